@@ -9,174 +9,491 @@ as the UI template. Each page embeds the lemma data so it works offline.
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
+import itertools
 import json
 import os
 import re
+import sys
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
 import psycopg
 from psycopg.rows import dict_row
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+try:
+    import liburing
+except ImportError:  # pragma: no cover - optional, Linux 5.1+ only
+    liburing = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, gzip-only sidecars
+    brotli = None
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # pragma: no cover - blake2b fallback
+    _blake3 = None
+
 DSN = "dbname=lexdb_gemini user=David.He host=localhost"
 TEMPLATE_PATH = Path("lexdb_sql1.html")
+EXPORT_CACHE_NAME = ".export_cache.json"
 
 SLUG_SAFE_RE = re.compile(r"[^a-z0-9]+")
 
+# ASCII fast path: one bytes-pattern pass replaces and collapses every
+# run outside [a-z0-9] at once. NFKC is a no-op on ASCII.
+_SLUG_SAFE_RE_B = re.compile(rb"[^a-z0-9]+")
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _compress_variants(blob: bytes) -> List[Tuple[str, bytes]]:
+    # Cloudflare Pages serves .gz/.br sidecars transparently, so emit them
+    # at export time next to the plain file.
+    # mtime=0 keeps the gzip bytes deterministic for identical input, so
+    # the hash cache can skip unchanged sidecars across runs.
+    variants = [("", blob), (".gz", gzip.compress(blob, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(blob, quality=11)))
+    return variants
+
+
+def _serialize_chunk(args: Tuple[List[Dict], str]) -> Tuple[List[Tuple[str, bytes]], bytes]:
+    # Top-level so ProcessPoolExecutor workers can pickle it. Each entry and
+    # its manifest row are encoded exactly once; the chunk payload and the
+    # manifest fragment are assembled from those fragments with byte joins.
+    # Compression happens here too, so it parallelizes with serialization.
+    chunk, chunk_name = args
+    blobs = [_dumps(e) for e in chunk]
+    mblobs = [
+        _dumps({"lemma": e["lemma"], "slug": e["slug"], "chunk": chunk_name})
+        for e in chunk
+    ]
+    payload = b"[" + b",".join(blobs) + b"]"
+    files = [(chunk_name + suffix, data) for suffix, data in _compress_variants(payload)]
+    return files, b",".join(mblobs)
+
 
 def slugify(text: str) -> str:
     if not text:
         return "untitled"
-    s = unicodedata.normalize("NFKC", text).strip().lower()
-    s = SLUG_SAFE_RE.sub("-", s).strip("-")
-    return s or "untitled"
+    try:
+        b = text.encode("ascii")
+    except UnicodeEncodeError:
+        s = unicodedata.normalize("NFKC", text).strip().lower()
+        s = SLUG_SAFE_RE.sub("-", s).strip("-")
+        return s or "untitled"
+    sb = _SLUG_SAFE_RE_B.sub(b"-", b.lower()).strip(b"-")
+    return sb.decode("ascii") or "untitled"
+
+
+TEMPLATE_MARKER = b'<script src="https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2"></script>'
 
 
-def load_template() -> str:
-    return TEMPLATE_PATH.read_text(encoding="utf-8")
+def load_template_split() -> Tuple[bytes, bytes]:
+    # Locate the marker once; every page is then head + inject + tail
+    # with no per-page template scan. The tail keeps the marker.
+    tpl = TEMPLATE_PATH.read_bytes()
+    idx = tpl.find(TEMPLATE_MARKER)
+    if idx < 0:
+        raise ValueError("Template missing supabase script tag.")
+    return tpl[:idx], tpl[idx:]
 
 
-def inject_data(template: str, data: Dict) -> str:
-    payload = json.dumps(data, ensure_ascii=False)
+def build_inject_bytes(data: Dict) -> bytes:
+    payload = _dumps(data).decode("utf-8")
     title = (data.get("lemma") or "Logodaedaly").strip()
     inject = (
         f"<script>window.__LEMMA_DATA__ = {payload};"
         f"document.title = {json.dumps(title + ' — Logodaedaly')};"
         f"</script>\n"
     )
-    marker = '<script src="https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2"></script>'
-    if marker not in template:
-        raise ValueError("Template missing supabase script tag.")
-    return template.replace(marker, inject + marker, 1)
+    return inject.encode("utf-8")
+
+
+def inject_data(head: bytes, tail: bytes, data: Dict) -> bytes:
+    return head + build_inject_bytes(data) + tail
 
-def inject_index(template: str) -> str:
+def inject_index(head: bytes, tail: bytes) -> bytes:
     inject = (
         "<script>"
-        f"window.__STATIC_INDEX__ = true;"
-        f"window.__API_BASE__ = '';"
+        "window.__STATIC_INDEX__ = true;"
+        "window.__API_BASE__ = '';"
         "window.__MOBILE__ = window.matchMedia('(max-width: 760px)').matches;"
         "document.title = 'Logodaedaly — English Dictionary for Serious Learners';"
         "</script>\n"
     )
-    marker = '<script src="https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2"></script>'
-    if marker not in template:
-        raise ValueError("Template missing supabase script tag.")
-    return template.replace(marker, inject + marker, 1)
+    return head + inject.encode("utf-8") + tail
+
+
+ENTRY_COLUMNS = ("lemma", "ipa", "pos", "freq", "morphology",
+                 "etymology", "related", "senses")
 
 
-def fetch_entries() -> List[Dict]:
+def _entry_row(cols: Dict[str, List], slugs: List[str], i: int) -> Dict:
+    row = {name: cols[name][i] for name in ENTRY_COLUMNS}
+    row["slug"] = slugs[i]
+    return row
+
+
+def fetch_entries() -> Dict[str, List]:
+    # Aggregate senses server-side so each row arrives with them nested,
+    # instead of merging one row per (entry, sense) in Python.
     query = """
-        SELECT e.id AS entry_id, e.lemma, e.pos, e.ipa, e.freq, e.morphology,
+        SELECT e.lemma, e.pos, e.ipa, e.freq, e.morphology,
                e.etymology, e.related,
-               s.id AS sense_id, s.attr, s.def, s.ex
+               COALESCE(
+                   json_agg(
+                       json_build_object('id', s.id, 'attr', s.attr,
+                                         'def', s.def, 'ex', s.ex)
+                       ORDER BY s.id
+                   ) FILTER (WHERE s.id IS NOT NULL),
+                   '[]'::json
+               ) AS senses
         FROM test.entries e
-        JOIN test.senses s ON s.entry_id = e.id
-        ORDER BY e.lemma, s.id
+        LEFT JOIN test.senses s ON s.entry_id = e.id
+        GROUP BY e.id
+        ORDER BY e.lemma
     """
-    entries: Dict[str, Dict] = {}
+    # Columnar (structure-of-arrays) layout: the slug and manifest passes
+    # only touch lemmas, so keep each field in its own contiguous list and
+    # assemble per-entry dicts on demand via _entry_row.
+    cols: Dict[str, List] = {name: [] for name in ENTRY_COLUMNS}
+    lemmas, ipas, poses = cols["lemma"], cols["ipa"], cols["pos"]
+    freqs, morphs = cols["freq"], cols["morphology"]
+    etyms, relateds, senses_col = cols["etymology"], cols["related"], cols["senses"]
     with psycopg.connect(DSN, row_factory=dict_row) as conn:
-        with conn.cursor() as cur:
+        # Named cursor streams rows in itersize batches instead of
+        # buffering the whole result set client-side; binary protocol
+        # skips text reparsing of ids/freqs and json columns.
+        with conn.cursor(name="export_entries", binary=True) as cur:
+            cur.itersize = 10000
             cur.execute(query)
             for row in cur:
-                lemma = row["lemma"]
-                if lemma not in entries:
-                    entries[lemma] = {
-                        "lemma": row["lemma"],
-                        "ipa": row["ipa"],
-                        "pos": row["pos"],
-                        "freq": row["freq"],
-                        "morphology": row["morphology"],
-                        "etymology": row["etymology"],
-                        "related": row["related"],
-                        "senses": [],
-                    }
-                entries[lemma]["senses"].append(
-                    {
-                        "id": row["sense_id"],
-                        "attr": row["attr"],
-                        "def": row["def"],
-                        "ex": row["ex"],
-                    }
-                )
-    return list(entries.values())
-
-
-def ensure_unique_slug(slug: str, used: Dict[str, int]) -> str:
-    if slug not in used:
-        used[slug] = 1
+                # pos/attr draw from a handful of values repeated across
+                # thousands of rows; interning collapses them to shared
+                # string objects.
+                pos = row["pos"]
+                senses = row["senses"]
+                for sense in senses:
+                    attr = sense.get("attr")
+                    if attr:
+                        sense["attr"] = sys.intern(attr)
+                lemmas.append(row["lemma"])
+                ipas.append(row["ipa"])
+                poses.append(sys.intern(pos) if pos else pos)
+                freqs.append(row["freq"])
+                morphs.append(row["morphology"])
+                etyms.append(row["etymology"])
+                relateds.append(row["related"])
+                senses_col.append(senses)
+    return cols
+
+
+def ensure_unique_slug(slug: str, seen: Set[str], dups: Dict[str, int]) -> str:
+    # Common (collision-free) case is one set lookup + add; counters are
+    # only allocated for slugs that actually collide.
+    if slug not in seen:
+        seen.add(slug)
         return slug
-    used[slug] += 1
-    return f"{slug}-{used[slug]}"
-
-
-def chunked(items: List[Dict], size: int) -> List[List[Dict]]:
-    return [items[i:i + size] for i in range(0, len(items), size)]
-
-
-def write_sitemap(out_dir: Path, manifest: List[Dict[str, str]], base_url: str) -> int:
+    dups[slug] = n = dups.get(slug, 1) + 1
+    return f"{slug}-{n}"
+
+
+def chunked(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    # Yield chunks of references lazily instead of materializing every
+    # sublist (plus the list of sublists) via O(N) slicing up front.
+    it = iter(items)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _drain_cqes(ring, batch: List[Tuple[int, int]]) -> None:
+    # Submit the prepared batch, reap one CQE per op (completions may
+    # arrive out of order, so ops are matched via user_data), and close
+    # the batch's fds whatever happens.
+    liburing.io_uring_submit(ring)
+    cqe = liburing.io_uring_cqe()
+    try:
+        for _ in batch:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            res = cqe.res
+            idx = cqe.user_data
+            liburing.io_uring_cqe_seen(ring, cqe)
+            if res < 0:
+                raise OSError(-res, os.strerror(-res))
+            expected = batch[idx][1]
+            if res != expected:
+                raise OSError(f"short write: {res} of {expected} bytes")
+    finally:
+        for fd, _ in batch:
+            os.close(fd)
+
+
+def _flush_writes_io_uring(pending: List[Tuple[str, bytes]], depth: int = 64) -> None:
+    # One submission batch per `depth` files instead of one syscall per
+    # file. Fds are closed as each batch's completions are reaped, so at
+    # most `depth` files are open at once; `pending` keeps every buffer
+    # alive until its completion arrives.
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(depth, ring, 0)
+    batch: List[Tuple[int, int]] = []
+    try:
+        for path, blob in pending:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            batch.append((fd, len(blob)))
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, fd, blob, len(blob), 0)
+            sqe.user_data = len(batch) - 1
+            if len(batch) == depth:
+                full, batch = batch, []
+                _drain_cqes(ring, full)
+        if batch:
+            last, batch = batch, []
+            _drain_cqes(ring, last)
+    except BaseException:
+        # Only fds never handed to _drain_cqes remain here; drained
+        # batches close their own.
+        for fd, _ in batch:
+            os.close(fd)
+        raise
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+def _hash_blob(blob: bytes) -> str:
+    if _blake3 is not None:
+        return _blake3(blob).hexdigest()
+    return hashlib.blake2b(blob, digest_size=32).hexdigest()
+
+
+def skip_unchanged(pending: List[Tuple[str, bytes]],
+                   out_dir: Path) -> Tuple[List[Tuple[str, bytes]], Dict[str, str]]:
+    # Hash each payload against the previous export's hashes so incremental
+    # runs only rewrite files whose content actually changed. The caller
+    # persists the returned hashes once the flush has succeeded; writing
+    # them here would let a failed flush leave stale files that every
+    # later run skips.
+    cache_path = out_dir / EXPORT_CACHE_NAME
+    old_hashes: Dict[str, str] = {}
+    if cache_path.exists():
+        try:
+            old_hashes = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (ValueError, OSError):
+            old_hashes = {}
+    new_hashes: Dict[str, str] = {}
+    changed: List[Tuple[str, bytes]] = []
+    for path, blob in pending:
+        name = os.path.relpath(path, out_dir)
+        h = _hash_blob(blob)
+        new_hashes[name] = h
+        if old_hashes.get(name) != h or not os.path.exists(path):
+            changed.append((path, blob))
+    return changed, new_hashes
+
+
+def flush_writes(pending: List[Tuple[str, bytes]], use_io_uring: bool = False) -> None:
+    if use_io_uring and liburing is not None and sys.platform == "linux":
+        _flush_writes_io_uring(pending)
+        return
+    # os.open/os.write instead of Path.write_bytes: no Path allocation or
+    # BufferedWriter wrapper per file in the hot loop.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    for path, blob in pending:
+        fd = os.open(path, flags, 0o644)
+        try:
+            os.write(fd, blob)
+        finally:
+            os.close(fd)
+
+
+def write_sitemap(out_dir: Path, slugs: List[str], base_url: str) -> int:
     base = base_url.rstrip("/")
-    urls = [f"{base}/"] + [f"{base}/lemma/{m['slug']}" for m in manifest]
+    urls = [f"{base}/"] + [f"{base}/lemma/{s}" for s in slugs]
 
-    def render_urlset(url_list: List[str]) -> str:
-        lines = ['<?xml version="1.0" encoding="UTF-8"?>',
-                 '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    def render_urlset(url_list: List[str]) -> bytes:
+        # Stream into one growing buffer instead of a list of f-strings + join.
+        buf = bytearray(b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
         for u in url_list:
-            lines.append(f"  <url><loc>{u}</loc></url>")
-        lines.append("</urlset>")
-        return "\n".join(lines) + "\n"
+            buf += b"  <url><loc>"
+            buf += u.encode("utf-8")
+            buf += b"</loc></url>\n"
+        buf += b"</urlset>\n"
+        return bytes(buf)
+
+    def write_xml(name: str, blob: bytes) -> None:
+        for suffix, data in _compress_variants(blob):
+            (out_dir / (name + suffix)).write_bytes(data)
 
     # Split into multiple sitemaps if over 50k URLs.
     max_urls = 50000
     if len(urls) <= max_urls:
-        (out_dir / "sitemap.xml").write_text(render_urlset(urls), encoding="utf-8")
+        write_xml("sitemap.xml", render_urlset(urls))
         return 1
 
     chunks = [urls[i:i + max_urls] for i in range(0, len(urls), max_urls)]
     sitemap_files = []
     for i, chunk in enumerate(chunks, 1):
         name = f"sitemap-{i}.xml"
-        (out_dir / name).write_text(render_urlset(chunk), encoding="utf-8")
+        write_xml(name, render_urlset(chunk))
         sitemap_files.append(name)
 
-    index_lines = ['<?xml version="1.0" encoding="UTF-8"?>',
-                   '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    buf = bytearray(b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                    b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
     for name in sitemap_files:
-        index_lines.append(f"  <sitemap><loc>{base}/{name}</loc></sitemap>")
-    index_lines.append("</sitemapindex>")
-    (out_dir / "sitemap.xml").write_text("\n".join(index_lines) + "\n", encoding="utf-8")
+        buf += b"  <sitemap><loc>"
+        buf += f"{base}/{name}".encode("utf-8")
+        buf += b"</loc></sitemap>\n"
+    buf += b"</sitemapindex>\n"
+    write_xml("sitemap.xml", bytes(buf))
     return len(sitemap_files)
 
 
-def write_site(out_dir: Path, chunk_size: int, base_url: str) -> Tuple[int, int, int]:
-    template = load_template()
-    entries = fetch_entries()
+def write_lemma_pages(out_dir: Path, head: bytes, tail: bytes,
+                      entries: Iterable[Dict]) -> int:
+    # head/tail are identical for every page, so share one buffer each and
+    # let writev gather [head, inject, tail] into a single kernel write
+    # with no Python-side concatenation of the large template body.
+    pages_dir = out_dir / "lemma"
+    head_mv = memoryview(head)
+    tail_mv = memoryview(tail)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    count = 0
+    for entry in entries:
+        page_dir = pages_dir / entry["slug"]
+        page_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(page_dir / "index.html", flags, 0o644)
+        try:
+            os.writev(fd, [head_mv, memoryview(build_inject_bytes(entry)), tail_mv])
+        finally:
+            os.close(fd)
+        count += 1
+    return count
+
+
+def write_site(out_dir: Path, chunk_size: int, base_url: str,
+               use_io_uring: bool = False,
+               lemma_pages: bool = False) -> Tuple[int, int, int]:
+    head, tail = load_template_split()
+    cols = fetch_entries()
     data_dir = out_dir / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    used_slugs: Dict[str, int] = {}
-    manifest: List[Dict[str, str]] = []
-
-    enriched: List[Dict] = []
-    for entry in entries:
-        slug = ensure_unique_slug(slugify(entry["lemma"]), used_slugs)
-        enriched.append({**entry, "slug": slug})
-
-    chunks = chunked(enriched, chunk_size)
-    for i, chunk in enumerate(chunks):
-        chunk_name = f"chunk-{i:04d}.json"
-        for item in chunk:
-            manifest.append({"lemma": item["lemma"], "slug": item["slug"], "chunk": chunk_name})
-        (data_dir / chunk_name).write_text(json.dumps(chunk, ensure_ascii=False), encoding="utf-8")
-
-    # Write a static manifest for landing animation/search + routing.
-    manifest_path = out_dir / "manifest.json"
-    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    seen_slugs: Set[str] = set()
+    dup_counts: Dict[str, int] = {}
+
+    # The slug pass is a tight loop over the lemma column alone; full
+    # per-entry dicts are only assembled when their chunk is serialized.
+    lemmas = cols["lemma"]
+    slugs = [ensure_unique_slug(slugify(lemma), seen_slugs, dup_counts)
+             for lemma in lemmas]
+    n_entries = len(lemmas)
+
+    n_chunks = (n_entries + chunk_size - 1) // chunk_size
+    chunk_names = [f"chunk-{i:04d}.json" for i in range(n_chunks)]
+    chunks = chunked((_entry_row(cols, slugs, i) for i in range(n_entries)),
+                     chunk_size)
+
+    # Chunk serialization is CPU-bound and embarrassingly parallel. Each
+    # worker returns the chunk payload plus its manifest fragment so no
+    # entry is traversed by an encoder twice.
+    data_dir_str = str(data_dir)
+    out_dir_str = str(out_dir)
+    pending: List[Tuple[str, bytes]] = []
+    # Also bundle the plain chunk payloads into one append-only blob with a
+    # byte-offset index, so clients can Range-request data.bin instead of
+    # fetching hundreds of tiny files.
+    bundle_parts: List[bytes] = []
+    bundle_index: Dict[str, List[int]] = {}
+    offset = 0
+
+    # Stream the manifest (for landing animation/search + routing) straight
+    # to disk as fragments arrive, instead of holding every fragment plus
+    # the joined payload in memory. Sidecars compress incrementally too.
+    # Streams go to .tmp names first so a failed run keeps the previous
+    # manifest intact rather than leaving truncated JSON behind.
+    manifest_path = os.path.join(out_dir_str, "manifest.json")
+    mf = open(manifest_path + ".tmp", "wb")
+    # GzipFile rather than gzip.open so mtime can be pinned to 0 for
+    # deterministic output.
+    mf_gz_raw = open(manifest_path + ".gz.tmp", "wb")
+    mf_gz = gzip.GzipFile(filename="", mode="wb", fileobj=mf_gz_raw,
+                          compresslevel=9, mtime=0)
+    br_comp = brotli.Compressor(quality=11) if brotli is not None else None
+    mf_br = open(manifest_path + ".br.tmp", "wb") if br_comp is not None else None
+
+    def mf_write(fragment: bytes) -> None:
+        mf.write(fragment)
+        mf_gz.write(fragment)
+        if mf_br is not None:
+            mf_br.write(br_comp.process(fragment))
+
+    try:
+        mf_write(b"[")
+        first_frag = True
+        with ProcessPoolExecutor() as ex:
+            for files, mfrag in ex.map(_serialize_chunk, zip(chunks, chunk_names),
+                                       chunksize=4):
+                for name, blob in files:
+                    pending.append((os.path.join(data_dir_str, name), blob))
+                chunk_name, payload = files[0]
+                bundle_index[chunk_name] = [offset, len(payload)]
+                bundle_parts.append(payload)
+                offset += len(payload)
+                if mfrag:
+                    mf_write(mfrag if first_frag else b"," + mfrag)
+                    first_frag = False
+        mf_write(b"]")
+        if mf_br is not None:
+            mf_br.write(br_comp.finish())
+    finally:
+        mf.close()
+        mf_gz.close()
+        mf_gz_raw.close()
+        if mf_br is not None:
+            mf_br.close()
+
+    os.replace(manifest_path + ".tmp", manifest_path)
+    os.replace(manifest_path + ".gz.tmp", manifest_path + ".gz")
+    if mf_br is not None:
+        os.replace(manifest_path + ".br.tmp", manifest_path + ".br")
+
+    pending.append((os.path.join(data_dir_str, "data.bin"), b"".join(bundle_parts)))
+    pending.append((os.path.join(data_dir_str, "chunks.idx"), _dumps(bundle_index)))
+    changed, new_hashes = skip_unchanged(pending, out_dir)
+    flush_writes(changed, use_io_uring)
+    # Persist the hashes only after the flush succeeded, so an interrupted
+    # run never records files it did not actually write.
+    (out_dir / EXPORT_CACHE_NAME).write_text(json.dumps(new_hashes), encoding="utf-8")
 
     # Write index page (auto-adapts to mobile).
     index_path = out_dir / "index.html"
-    index_html = inject_index(template)
-    index_path.write_text(index_html, encoding="utf-8")
+    index_path.write_bytes(inject_index(head, tail))
+
+    # Optional static per-lemma pages (offline/SEO); served ahead of the
+    # SPA fallback by Cloudflare Pages.
+    if lemma_pages:
+        write_lemma_pages(out_dir, head, tail,
+                          (_entry_row(cols, slugs, i) for i in range(n_entries)))
 
     # SPA fallback for Cloudflare Pages
     redirects_path = out_dir / "_redirects"
@@ -187,8 +504,8 @@ def write_site(out_dir: Path, chunk_size: int, base_url: str) -> Tuple[int, int,
         encoding="utf-8"
     )
 
-    sitemap_count = write_sitemap(out_dir, manifest, base_url)
-    return len(entries), len(chunks), sitemap_count
+    sitemap_count = write_sitemap(out_dir, slugs, base_url)
+    return n_entries, n_chunks, sitemap_count
 
 
 def main() -> int:
@@ -197,11 +514,22 @@ def main() -> int:
     ap.add_argument("--chunk-size", type=int, default=1000)
     ap.add_argument("--base-url", default=os.environ.get("LOGODAEDALY_BASE_URL", "https://logodaedaly.pages.dev"),
                     help="Base URL for sitemap (default: https://logodaedaly.pages.dev)")
+    ap.add_argument("--io-uring", action="store_true",
+                    help="Batch chunk writes through io_uring (requires liburing, Linux 5.1+)")
+    ap.add_argument("--lemma-pages", action="store_true",
+                    help="Also emit a static HTML page per lemma under lemma/<slug>/")
     args = ap.parse_args()
 
+    use_io_uring = args.io_uring
+    if use_io_uring and (liburing is None or sys.platform != "linux"):
+        print("io_uring unavailable (liburing not installed or not Linux); using plain writes",
+              file=sys.stderr)
+        use_io_uring = False
+
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
-    count, chunks, sitemaps = write_site(out_dir, args.chunk_size, args.base_url)
+    count, chunks, sitemaps = write_site(out_dir, args.chunk_size, args.base_url,
+                                         use_io_uring, args.lemma_pages)
     print(f"Wrote {count} entries into {chunks} data chunks in {out_dir}")
     print(f"Wrote {sitemaps} sitemap file(s) in {out_dir}")
     return 0